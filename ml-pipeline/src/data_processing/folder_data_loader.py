@@ -6,29 +6,113 @@ Currently configured for Scottsdale data, but easily adaptable for other cities.
 """
 
 import pandas as pd
+import numpy as np
 import requests
-from io import StringIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import io
+import json
+import os
+import platform
+import functools
+import hashlib
+import time
 import logging
-from typing import Dict, Optional, List
+import logging.handlers
+from pathlib import Path
+from typing import Dict, Iterator, Optional, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import warnings
 import re
 warnings.filterwarnings('ignore')
 
+try:
+    import pyarrow  # noqa: F401 - enables the multithreaded CSV parser
+    import pyarrow.parquet
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Cached parquet files are memory-mapped where pyarrow supports it well
+_MMAP_CACHE_READS = _HAS_PYARROW and platform.system() == "Linux"
+
+# Downloaded datasets are cached on disk for a day by default
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+
+# Parallel downloads share one connection pool; never run more workers than
+# it has connections, or threads block waiting for a free socket
+HTTP_POOL_MAXSIZE = 16
+MAX_DOWNLOAD_WORKERS = 8
+
+# Files larger than this are parsed in chunks to bound peak memory
+CHUNKED_READ_THRESHOLD = 10 * 1024**2
+CSV_CHUNKSIZE = 100_000
+
+# pandas can only infer compression from a path, not a stream, so infer it
+# from the configured filename instead
+_COMPRESSION_BY_SUFFIX = {'.gz': 'gzip', '.bz2': 'bz2'}
+
+# Google Drive sharing URL shapes that carry a file ID
+_FILE_ID_PATTERNS = (
+    re.compile(r'/file/d/([a-zA-Z0-9-_]+)/'),
+    re.compile(r'id=([a-zA-Z0-9-_]+)'),
+)
+
+def _memory_bytes(obj) -> int:
+    """
+    Memory used by a DataFrame or Series
+    
+    deep=True walks every Python object in object columns, which can cost more
+    than parsing the file, so it is only used when STR_LOADER_DEEP_MEM=1.
+    """
+    deep = os.environ.get("STR_LOADER_DEEP_MEM") == "1"
+    usage = obj.memory_usage(deep=deep, index=False)
+    return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+
+def _downcast_arrow_integers(column: pd.Series) -> Optional[pd.Series]:
+    """Arrow-backed integer column recast to its smallest fitting width, or None"""
+    low, high = column.min(), column.max()
+    if pd.isna(low):
+        return None
+    
+    if pd.api.types.is_unsigned_integer_dtype(column.dtype):
+        kinds = (np.uint8, np.uint16, np.uint32)
+    else:
+        kinds = (np.int8, np.int16, np.int32)
+    for kind in kinds:
+        info = np.iinfo(kind)
+        if info.min <= low and high <= info.max:
+            target = pd.ArrowDtype(pyarrow.from_numpy_dtype(kind))
+            return None if target == column.dtype else column.astype(target)
+    return None
+
 class STRDataLoader:
     """General STR data loader - works with any city's Google Drive folder"""
     
-    def __init__(self, city_name="Scottsdale", folder_id=None):
+    def __init__(self, city_name="Scottsdale", folder_id=None, cache_dir=None,
+                 cache_ttl=DEFAULT_CACHE_TTL, category_threshold=0.5):
         """
         Initialize data loader for any city
         
         Args:
             city_name: Name of the city (for display purposes)
             folder_id: Google Drive folder ID (None to use default Scottsdale)
+            cache_dir: Directory for cached downloads (None uses $STR_CACHE_DIR
+                or ~/.cache/str_loader)
+            cache_ttl: Seconds a cached download stays fresh (0 disables the cache)
+            category_threshold: String columns whose unique/total ratio is below
+                this are stored as categoricals (0 disables the conversion)
         """
         self.city_name = city_name
         self.folder_id = folder_id or "1FEInC_DsWaQo8XIvydEGL1e0si7wqvFg"  # Default: Your Scottsdale folder
         self.logger = logging.getLogger(__name__)
         
+        # On-disk cache of parsed downloads, keyed by Google Drive file ID
+        cache_dir = cache_dir or os.environ.get("STR_CACHE_DIR", "~/.cache/str_loader")
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_ttl = cache_ttl
+        self.category_threshold = category_threshold
+        
         # City-specific file configurations
         self.city_configs = {
             "Scottsdale": {
@@ -107,9 +191,49 @@ class STRDataLoader:
         else:
             self.file_configs = {}
             self.logger.warning(f"No configuration found for {city_name}")
+        self._index_categories()
         
         # Storage for loaded datasets
         self.datasets = {}
+        self._memory_saved = {}
+        
+        # Bumped whenever self.datasets changes; invalidates memoised views of it
+        self._datasets_version = 0
+        self._category_cache = None
+        
+        # Shared HTTP session: keep-alive connections to drive.google.com are
+        # reused across downloads instead of re-handshaking for every file
+        self._session = requests.Session()
+        self._session.headers.update({
+            'User-Agent': 'str-nuisance-prediction/STRDataLoader',
+            # CSV compresses well; the body is inflated by urllib3 while pandas parses it
+            'Accept-Encoding': 'gzip, deflate',
+        })
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retries)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+    
+    def close(self):
+        """Close the underlying HTTP session"""
+        session = getattr(self, '_session', None)
+        if session is not None:
+            session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        self.close()
+    
+    def _index_categories(self):
+        """Group dataset keys by category once, in configuration order"""
+        self._keys_by_category = {}
+        for key, config in self.file_configs.items():
+            self._keys_by_category.setdefault(config.get('category', 'other'), []).append(key)
     
     def add_city_config(self, city_name: str, file_mappings: Dict, folder_id: str = None):
         """
@@ -117,7 +241,9 @@ class STRDataLoader:
         
         Args:
             city_name: Name of the city
-            file_mappings: Dictionary of file configurations
+            file_mappings: Dictionary of file configurations. Each entry may also
+                set optional 'usecols' and 'dtype' keys, forwarded to
+                pd.read_csv to skip unneeded columns and type inference
             folder_id: Google Drive folder ID for the city
         """
         self.city_configs[city_name] = {"file_mappings": file_mappings}
@@ -126,9 +252,9 @@ class STRDataLoader:
             # Update folder ID if provided
             self.folder_id = folder_id
             
-        print(f"✅ Added configuration for {city_name}")
-        print(f"📁 Folder ID: {self.folder_id}")
-        print(f"📊 Datasets: {len(file_mappings)}")
+        self.logger.info(f"✅ Added configuration for {city_name}")
+        self.logger.info(f"📁 Folder ID: {self.folder_id}")
+        self.logger.info(f"📊 Datasets: {len(file_mappings)}")
     
     def setup_file_links(self, file_links: Dict[str, str]):
         """
@@ -146,35 +272,35 @@ class STRDataLoader:
             file_id = self.extract_file_id(url)
             self.file_configs[dataset_key]['file_id'] = file_id
             
-        print(f"🔗 Updated file links for {self.city_name}")
+        self.logger.info(f"🔗 Updated file links for {self.city_name}")
     
-    def extract_file_id(self, url: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def extract_file_id(url: str) -> str:
         """Extract file ID from Google Drive URL"""
-        patterns = [
-            r'/file/d/([a-zA-Z0-9-_]+)/',
-            r'id=([a-zA-Z0-9-_]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in _FILE_ID_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         
         return url.strip()  # Assume it's already just the ID
     
-    def get_direct_download_url(self, file_id: str) -> str:
-        """Convert Google Drive file ID to direct download URL"""
-        return f"https://drive.google.com/uc?id={file_id}&export=download"
+    def get_direct_download_url(self, file_id: str, confirm: bool = True) -> str:
+        """
+        Convert Google Drive file ID to direct download URL
+        
+        confirm=t pre-accepts the virus-scan warning Drive shows for large files,
+        so the file comes back in a single request.
+        """
+        url = f"https://drive.google.com/uc?id={file_id}&export=download"
+        return f"{url}&confirm=t" if confirm else url
     
-    def load_dataset(self, dataset_key: str) -> Optional[pd.DataFrame]:
+    def _resolve_file(self, dataset_key: str) -> Optional[tuple]:
         """
-        Load a specific dataset from Google Drive
+        Look up the configuration and Drive file ID for a dataset
         
-        Args:
-            dataset_key: Key from file_configs
-            
         Returns:
-            DataFrame or None if loading fails
+            Tuple of (config, file_id) or None if the dataset can't be downloaded
         """
         if dataset_key not in self.file_configs:
             self.logger.error(f"Unknown dataset: {dataset_key}")
@@ -187,21 +313,48 @@ class STRDataLoader:
             self.logger.warning(f"No file ID for {dataset_key}")
             return None
         
-        try:
-            url = self.get_direct_download_url(file_id)
+        return config, file_id
+    
+    def load_dataset(self, dataset_key: str, force_refresh: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Load a specific dataset from Google Drive
+        
+        Args:
+            dataset_key: Key from file_configs
+            force_refresh: Ignore the on-disk cache and download again
             
+        Returns:
+            DataFrame or None if loading fails
+        """
+        resolved = self._resolve_file(dataset_key)
+        if resolved is None:
+            return None
+        config, file_id = resolved
+        
+        cache_path = self._cache_path(file_id, config)
+        cached = None if force_refresh else self._read_cache(cache_path, file_id)
+        if cached is not None:
+            self._memory_saved[dataset_key] = self._optimize_dtypes(cached)
+            self.logger.info(f"💾 {config['filename']}: loaded from cache")
+            return cached
+        
+        try:
             self.logger.info(f"📥 Loading {config['filename']}...")
             
-            response = requests.get(url, timeout=120)
-            response.raise_for_status()
+            response, stream = self._open_download(file_id)
+            try:
+                # Parse straight from the socket instead of buffering response.text
+                content_length = int(response.headers.get('Content-Length') or 0)
+                df = self._parse_csv(stream, config, content_length)
+                validators = self._validators(response)
+            finally:
+                response.close()
             
-            # Handle large files with virus scan warning
-            if len(response.text) < 1000 and 'virus scan' in response.text.lower():
-                url = f"https://drive.google.com/uc?id={file_id}&export=download&confirm=t"
-                response = requests.get(url, timeout=120)
+            # Cache the frame as parsed so category_threshold isn't baked into
+            # the entry; optimising is cheap next to the download it saves
+            self._write_cache(cache_path, df, validators)
             
-            # Load CSV
-            df = pd.read_csv(StringIO(response.text), low_memory=False)
+            self._memory_saved[dataset_key] = self._optimize_dtypes(df)
             
             self.logger.info(f"✅ {config['filename']}: {df.shape[0]:,} rows × {df.shape[1]} columns")
             
@@ -211,135 +364,526 @@ class STRDataLoader:
             self.logger.error(f"❌ Failed to load {config['filename']}: {str(e)}")
             return None
     
-    def load_all_datasets(self) -> Dict[str, pd.DataFrame]:
+    def iter_dataset(self, dataset_key: str, chunksize: int = CSV_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+        """
+        Stream a dataset from Google Drive in chunks
+        
+        Lets callers process large files without holding the whole DataFrame
+        in memory. A fresh cached copy is streamed batch by batch. Chunks are
+        Arrow-backed as parsed and skip _optimize_dtypes, whose per-column
+        choices depend on the rows it sees and would differ between chunks.
+        Downloads infer each chunk's types separately; set 'dtype' in the
+        dataset config to pin them.
+        
+        Args:
+            dataset_key: Key from file_configs
+            chunksize: Rows per yielded DataFrame
+            
+        Yields:
+            DataFrames of at most chunksize rows
+        """
+        resolved = self._resolve_file(dataset_key)
+        if resolved is None:
+            return
+        config, file_id = resolved
+        
+        cache_path = self._cache_path(file_id, config)
+        if self._cache_is_fresh(cache_path, file_id):
+            try:
+                batches = self._iter_cache(cache_path, chunksize)
+            except Exception as e:
+                self.logger.warning(f"Ignoring unreadable cache file {cache_path}: {e}")
+            else:
+                yield from batches
+                return
+        
+        self.logger.info(f"📥 Streaming {config['filename']}...")
+        
+        # The PyArrow engine can't read in chunks; the C engine can still
+        # produce Arrow-backed columns to match _parse_csv
+        backend = {'dtype_backend': 'pyarrow'} if _HAS_PYARROW else {}
+        response, stream = self._open_download(file_id)
+        try:
+            yield from pd.read_csv(stream, chunksize=chunksize, low_memory=False,
+                                   **backend, **self._read_csv_options(config))
+        finally:
+            response.close()
+    
+    def iter_all_datasets(self, chunksize: int = CSV_CHUNKSIZE) -> Dict[str, Iterator[pd.DataFrame]]:
+        """
+        Lazily stream every configured dataset in chunks
+        
+        Nothing is downloaded until a dataset's iterator is consumed, so callers
+        can process files larger than memory one at a time.
+        
+        Args:
+            chunksize: Rows per yielded DataFrame
+            
+        Returns:
+            Dictionary of dataset names to chunk iterators
+        """
+        return {key: self.iter_dataset(key, chunksize) for key in self.file_configs}
+    
+    @staticmethod
+    def _read_csv_options(config: Dict) -> Dict:
+        """pd.read_csv keyword arguments derived from a dataset's configuration"""
+        suffix = Path(config.get('filename', '')).suffix.lower()
+        return {
+            # Optional per-dataset schema; None keeps every column with inferred types
+            'usecols': config.get('usecols'),
+            'dtype': config.get('dtype'),
+            'compression': _COMPRESSION_BY_SUFFIX.get(suffix),
+        }
+    
+    def _parse_csv(self, stream, config: Dict, content_length: int = 0) -> pd.DataFrame:
+        """Parse a CSV stream, preferring the multithreaded PyArrow reader when installed"""
+        schema = self._read_csv_options(config)
+        
+        if _HAS_PYARROW:
+            return pd.read_csv(stream, engine="pyarrow", dtype_backend="pyarrow", **schema)
+        
+        if content_length > CHUNKED_READ_THRESHOLD:
+            # The C engine doubles peak memory while consolidating one big
+            # parse; reading in chunks keeps each intermediate copy small
+            chunks = pd.read_csv(stream, chunksize=CSV_CHUNKSIZE, low_memory=False, **schema)
+            return pd.concat(chunks, ignore_index=True)
+        
+        return pd.read_csv(stream, low_memory=False, **schema)
+    
+    def _optimize_dtypes(self, df: pd.DataFrame) -> int:
+        """
+        Shrink column dtypes in place
+        
+        Integer columns, NumPy or Arrow-backed, are downcast to the smallest
+        integer type that holds their values, and low-cardinality string
+        columns become categoricals. Floats are left alone since float32 would round
+        coordinates and amounts.
+        
+        Args:
+            df: Freshly parsed DataFrame
+            
+        Returns:
+            Bytes of memory saved by the conversion
+        """
+        if len(df) == 0:
+            return 0
+        
+        saved = 0
+        for col in df.columns:
+            column = df[col]
+            dtype = column.dtype
+            
+            if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, pd.ArrowDtype):
+                converted = _downcast_arrow_integers(column)
+                if converted is None:
+                    continue
+            elif pd.api.types.is_integer_dtype(dtype):
+                downcast = 'unsigned' if pd.api.types.is_unsigned_integer_dtype(dtype) else 'integer'
+                converted = pd.to_numeric(column, downcast=downcast)
+            elif (self.category_threshold
+                  and (pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype))
+                  and column.nunique(dropna=True) / len(df) < self.category_threshold):
+                converted = column.astype("category")
+            else:
+                continue
+            
+            saved += _memory_bytes(column) - _memory_bytes(converted)
+            df[col] = converted
+        
+        return saved
+    
+    def _cache_path(self, file_id: str, config: Dict) -> Path:
+        """Location of the cached copy of a Drive file"""
+        usecols, dtype = config.get('usecols'), config.get('dtype')
+        if usecols is None and dtype is None:
+            return self.cache_dir / f"{file_id}.parquet"
+        
+        # A projected/typed parse is a different frame; don't share its cache entry
+        schema_hash = hashlib.sha1(repr((usecols, dtype)).encode()).hexdigest()[:8]
+        return self.cache_dir / f"{file_id}-{schema_hash}.parquet"
+    
+    def _cache_is_fresh(self, cache_path: Path, file_id: str) -> bool:
+        """
+        Check whether a cache entry can be used
+        
+        Entries within the TTL are used as-is. Older entries are revalidated
+        with a HEAD request and kept for another TTL if the ETag (or, failing
+        that, Last-Modified) is unchanged. Filesystem errors make the entry
+        count as stale, so a broken cache only ever costs a download.
+        """
+        if not self.cache_ttl:
+            return False
+        
+        try:
+            age = time.time() - os.path.getmtime(cache_path)
+        except OSError:
+            # Missing, or removed by another process since it was written
+            return False
+        
+        if age > self.cache_ttl:
+            if not self._cache_matches_remote(cache_path, file_id):
+                return False
+            try:
+                os.utime(cache_path)
+            except OSError as e:
+                # Read-only or shared cache dirs: still usable, just revalidated again next time
+                self.logger.warning(f"Could not renew cache entry {cache_path.name}: {e}")
+        
+        return True
+    
+    def _read_cache(self, cache_path: Path, file_id: str) -> Optional[pd.DataFrame]:
+        """Return the cached DataFrame if it is still fresh"""
+        if not self._cache_is_fresh(cache_path, file_id):
+            return None
+        
+        try:
+            if _MMAP_CACHE_READS:
+                return pd.read_parquet(cache_path, engine="pyarrow", memory_map=True,
+                                       dtype_backend="pyarrow")
+            if _HAS_PYARROW:
+                # Restore the Arrow-backed columns _parse_csv produced
+                return pd.read_parquet(cache_path, dtype_backend="pyarrow")
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache file {cache_path}: {e}")
+            return None
+    
+    @staticmethod
+    def _iter_cache(cache_path: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Open a cache entry for reading in batches of at most chunksize rows
+        
+        The file is opened eagerly so a corrupt entry fails here, before any
+        rows have been yielded.
+        """
+        if not _HAS_PYARROW:
+            df = pd.read_parquet(cache_path)
+            return (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize))
+        
+        # Map every column back to the Arrow-backed dtype _parse_csv produced
+        parquet_file = pyarrow.parquet.ParquetFile(cache_path, memory_map=_MMAP_CACHE_READS)
+        return (batch.to_pandas(types_mapper=pd.ArrowDtype)
+                for batch in parquet_file.iter_batches(batch_size=chunksize))
+    
+    @staticmethod
+    def _validators(response) -> Dict[str, Optional[str]]:
+        """HTTP cache validators identifying the downloaded version of a file"""
+        return {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+    
+    @staticmethod
+    def _meta_path(cache_path: Path) -> Path:
+        """Sidecar file holding the validators of a cache entry"""
+        return cache_path.with_name(cache_path.name + ".meta.json")
+    
+    def _cache_matches_remote(self, cache_path: Path, file_id: str) -> bool:
+        """Check a stale cache entry against the remote validators without downloading the file"""
+        try:
+            stored = json.loads(self._meta_path(cache_path).read_text())
+        except (OSError, ValueError):
+            return False
+        
+        try:
+            url = self.get_direct_download_url(file_id)
+            response = self._session.head(url, allow_redirects=True, timeout=10)
+            remote = self._validators(response)
+        except Exception as e:
+            self.logger.debug(f"Could not revalidate {cache_path.name}: {e}")
+            return False
+        
+        # Prefer the strong ETag validator; fall back to Last-Modified
+        for key in ('etag', 'last_modified'):
+            if stored.get(key) and remote[key]:
+                return stored[key] == remote[key]
+        return False
+    
+    def _write_cache(self, cache_path: Path, df: pd.DataFrame, validators: Optional[Dict] = None):
+        """Persist a downloaded DataFrame; failures only cost the next run a download"""
+        if not self.cache_ttl:
+            return
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial parquet
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            df.to_parquet(tmp_path, compression="zstd", index=False)
+            os.replace(tmp_path, cache_path)
+            
+            self._meta_path(cache_path).write_text(json.dumps(validators or {}))
+        except Exception as e:
+            self.logger.warning(f"Could not cache {cache_path.name}: {e}")
+    
+    def _open_download(self, file_id: str):
+        """
+        Open a streamed download for a Google Drive file
+        
+        Args:
+            file_id: Google Drive file ID
+            
+        Returns:
+            Tuple of (response, buffered reader over the decoded body)
+        """
+        url = self.get_direct_download_url(file_id)
+        response = self._session.get(url, timeout=(10, 120), stream=True)
+        response.raise_for_status()
+        stream = self._body_reader(response)
+        
+        # The confirm=t URL should skip the virus scan warning; if Drive still
+        # sends it, fail rather than parse HTML. CSV bodies come back as
+        # text/csv or octet-stream, so only HTML responses are peeked at, and
+        # peek() leaves the body unconsumed
+        is_html = 'text/html' in response.headers.get('Content-Type', '').lower()
+        if is_html and self._is_virus_scan_page(stream.peek(2048)[:2048]):
+            response.close()
+            raise ValueError(f"Google Drive returned its virus scan warning for {file_id}")
+        
+        return response, stream
+    
+    @staticmethod
+    def _is_virus_scan_page(head: bytes) -> bool:
+        """Check whether a body prefix is Drive's HTML virus-scan interstitial"""
+        # CSV bodies fail the cheap HTML prefix test, so only HTML gets lowered and scanned
+        if not head.lstrip()[:15].lower().startswith((b'<!doctype html', b'<html')):
+            return False
+        return b'virus scan' in head.lower()
+    
+    @staticmethod
+    def _body_reader(response) -> io.BufferedReader:
+        """Wrap a streamed response body in a peekable, decompressing reader"""
+        response.raw.decode_content = True
+        # urllib3 marks the body closed at EOF by default, which makes
+        # BufferedReader raise instead of returning b''; response.close() still cleans up
+        response.raw.auto_close = False
+        return io.BufferedReader(response.raw)
+    
+    def load_all_datasets(self, max_workers: int = MAX_DOWNLOAD_WORKERS, force_refresh: bool = False) -> Dict[str, pd.DataFrame]:
         """
         Load all configured datasets for the current city
         
+        Downloads are network-bound, so they run concurrently in a thread pool.
+        
+        Args:
+            max_workers: Maximum number of parallel downloads
+            force_refresh: Ignore the on-disk cache and download everything again
+            
         Returns:
             Dictionary of dataset names to DataFrames
         """
-        print(f"🔄 Loading all {self.city_name} STR datasets...")
-        print(f"📁 Google Drive Folder: {self.folder_id}")
-        print("=" * 50)
+        self.logger.info(f"🔄 Loading all {self.city_name} STR datasets...")
+        self.logger.info(f"📁 Google Drive Folder: {self.folder_id}")
+        self.logger.info("=" * 50)
         
-        self.datasets = {}
-        
-        for dataset_key, config in self.file_configs.items():
-            df = self.load_dataset(dataset_key)
-            self.datasets[dataset_key] = df
+        load_fn = functools.partial(self.load_dataset, force_refresh=force_refresh)
+        self.datasets = self._load_concurrently(load_fn, max_workers)
+        self._datasets_version += 1
         
         # Print summary
         self._print_loading_summary()
         
         return self.datasets
     
+    def load_all_arrow(self, max_workers: int = MAX_DOWNLOAD_WORKERS) -> Dict[str, "pyarrow.Table"]:
+        """
+        Load all configured datasets as Arrow tables, bypassing pandas
+        
+        Arrow tables can be joined by duckdb/polars/DataFusion without copying.
+        Use arrow_to_pandas() to convert a table when a DataFrame is needed.
+        
+        Args:
+            max_workers: Maximum number of parallel downloads
+            
+        Returns:
+            Dictionary of dataset names to Arrow tables (None where loading failed)
+        """
+        if not _HAS_PYARROW:
+            raise ImportError("load_all_arrow requires pyarrow")
+        
+        return self._load_concurrently(self._load_arrow_table, max_workers)
+    
+    def _load_arrow_table(self, dataset_key: str) -> Optional["pyarrow.Table"]:
+        """Download one dataset straight into an Arrow table"""
+        from pyarrow import csv as pa_csv
+        
+        resolved = self._resolve_file(dataset_key)
+        if resolved is None:
+            return None
+        config, file_id = resolved
+        
+        try:
+            self.logger.info(f"📥 Loading {config['filename']} (Arrow)...")
+            
+            response, stream = self._open_download(file_id)
+            try:
+                compression = self._read_csv_options(config)['compression']
+                if compression:
+                    stream = pyarrow.CompressedInputStream(stream, compression)
+                table = pa_csv.read_csv(
+                    stream,
+                    read_options=pa_csv.ReadOptions(use_threads=True),
+                    convert_options=pa_csv.ConvertOptions(include_columns=config.get('usecols')),
+                )
+            finally:
+                response.close()
+            
+            self.logger.info(f"✅ {config['filename']}: {table.num_rows:,} rows × {table.num_columns} columns")
+            
+            return table
+            
+        except Exception as e:
+            self.logger.error(f"❌ Failed to load {config['filename']}: {str(e)}")
+            return None
+    
+    def _load_concurrently(self, load_fn, max_workers: int) -> Dict:
+        """
+        Run a per-dataset loader over every configured dataset in a thread pool
+        
+        Downloads are network-bound and requests releases the GIL while waiting,
+        so threads overlap the latency of each file.
+        
+        Returns:
+            Dictionary of dataset names to results, in configuration order
+        """
+        results = {}
+        workers = max(1, min(max_workers, len(self.file_configs), HTTP_POOL_MAXSIZE))
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(load_fn, dataset_key): dataset_key
+                for dataset_key in self.file_configs
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        # Keep configuration order so summaries are stable between runs
+        return {key: results[key] for key in self.file_configs}
+    
     def _print_loading_summary(self):
         """Print summary of loaded datasets"""
         loaded_count = sum(1 for df in self.datasets.values() if df is not None)
         total_count = len(self.file_configs)
         
-        print(f"\n📊 {self.city_name.upper()} LOADING SUMMARY")
-        print("=" * 40)
-        print(f"✅ Successfully loaded: {loaded_count}/{total_count} datasets")
+        self.logger.info(f"\n📊 {self.city_name.upper()} LOADING SUMMARY")
+        self.logger.info("=" * 40)
+        self.logger.info(f"✅ Successfully loaded: {loaded_count}/{total_count} datasets")
         
         if loaded_count > 0:
             total_rows = 0
             total_memory = 0
             
-            # Group by category
-            categories = {}
-            for key, df in self.datasets.items():
-                if df is not None:
-                    category = self.file_configs[key].get('category', 'other')
-                    if category not in categories:
-                        categories[category] = []
-                    categories[category].append((key, df))
-            
             # Print by category
-            for category, datasets_list in categories.items():
-                print(f"\n📁 {category.upper()}:")
+            for category, keys in self._keys_by_category.items():
+                datasets_list = [(key, self.datasets[key]) for key in keys
+                                 if self.datasets.get(key) is not None]
+                if not datasets_list:
+                    continue
+                
+                self.logger.info(f"\n📁 {category.upper()}:")
                 for key, df in datasets_list:
                     rows = df.shape[0]
-                    memory_mb = df.memory_usage(deep=True).sum() / 1024**2
+                    memory_mb = _memory_bytes(df) / 1024**2
                     total_rows += rows
                     total_memory += memory_mb
                     
                     description = self.file_configs[key]['description']
-                    print(f"   ✅ {description}: {rows:,} rows ({memory_mb:.1f} MB)")
+                    self.logger.info(f"   ✅ {description}: {rows:,} rows ({memory_mb:.1f} MB)")
+            
+            self.logger.info(f"\n📈 TOTAL: {total_rows:,} rows, {total_memory:.1f} MB")
             
-            print(f"\n📈 TOTAL: {total_rows:,} rows, {total_memory:.1f} MB")
+            memory_saved = sum(self._memory_saved.get(key, 0) for key in self.datasets) / 1024**2
+            if memory_saved > 0:
+                self.logger.info(f"🗜️ Dtype optimisation saved {memory_saved:.1f} MB")
     
     def get_dataset_by_category(self) -> Dict[str, Dict[str, pd.DataFrame]]:
         """
         Get datasets organized by category
         
+        The grouping is memoised until the loaded datasets change, so treat the
+        returned dictionary as read-only.
+        
         Returns:
             Nested dictionary with categories and datasets
         """
+        if self._category_cache is not None and self._category_cache[0] == self._datasets_version:
+            return self._category_cache[1]
+        
         categories = {}
         
-        for key, df in self.datasets.items():
-            if key in self.file_configs:
-                category = self.file_configs[key].get('category', 'other')
-                if category not in categories:
-                    categories[category] = {}
-                categories[category][key] = df
+        for category, keys in self._keys_by_category.items():
+            loaded = {key: self.datasets[key] for key in keys if key in self.datasets}
+            if loaded:
+                categories[category] = loaded
         
+        self._category_cache = (self._datasets_version, categories)
         return categories
     
     def print_city_info(self):
         """Display information about the current city configuration"""
-        print(f"🏛️ {self.city_name.upper()} STR DATA CONFIGURATION")
-        print("=" * 50)
-        print(f"📁 Google Drive Folder: {self.folder_id}")
-        print(f"📊 Available Datasets: {len(self.file_configs)}")
+        self.logger.info(f"🏛️ {self.city_name.upper()} STR DATA CONFIGURATION")
+        self.logger.info("=" * 50)
+        self.logger.info(f"📁 Google Drive Folder: {self.folder_id}")
+        self.logger.info(f"📊 Available Datasets: {len(self.file_configs)}")
         
-        # Group by category for display
-        categories = {}
-        for key, config in self.file_configs.items():
-            category = config.get('category', 'other')
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(config)
-        
-        for category, configs in categories.items():
-            print(f"\n📋 {category.upper()}:")
-            for config in configs:
+        for category, keys in self._keys_by_category.items():
+            self.logger.info(f"\n📋 {category.upper()}:")
+            for key in keys:
+                config = self.file_configs[key]
                 status = "🔗 Ready" if config.get('file_id') else "⏳ Need setup"
-                print(f"   {status} {config['filename']}")
-                print(f"      └── {config['description']}")
+                self.logger.info(f"   {status} {config['filename']}")
+                self.logger.info(f"      └── {config['description']}")
     
     def create_sample_data_for_testing(self):
         """Create sample data when real data isn't available"""
-        print(f"🔧 Creating sample data for {self.city_name} testing...")
+        self.logger.info(f"🔧 Creating sample data for {self.city_name} testing...")
         
-        import numpy as np
-        from datetime import datetime, timedelta
-        
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         
         # Sample STR properties
         n_properties = 1000
+        house_numbers = rng.integers(1000, 9999, n_properties).astype(str)
+        streets = rng.choice(['Main St', 'Oak Ave', 'Elm Dr'], n_properties)
+        units = np.arange(1, n_properties + 1).astype(str)
+        addresses = np.char.add(np.char.add(np.char.add(house_numbers, ' '), np.char.add(streets, ' #')), units)
+        
+        property_types = ['Single Family', 'Condo', 'Townhouse']
         self.datasets['licensed_strs'] = pd.DataFrame({
-            'property_id': range(1, n_properties + 1),
-            'address': [f"{np.random.randint(1000, 9999)} {np.random.choice(['Main St', 'Oak Ave', 'Elm Dr'])} #{i}" 
-                       for i in range(1, n_properties + 1)],
-            'property_type': np.random.choice(['Single Family', 'Condo', 'Townhouse'], n_properties),
-            'bedrooms': np.random.choice([2, 3, 4, 5], n_properties),
+            'property_id': np.arange(1, n_properties + 1, dtype='int32'),
+            'address': addresses,
+            'property_type': pd.Categorical(rng.choice(property_types, n_properties), categories=property_types),
+            'bedrooms': rng.choice(np.array([2, 3, 4, 5], dtype='int8'), n_properties),
         })
         
         # Sample complaints
         n_complaints = 3000
+        complaint_types = ['Noise', 'Parking', 'Trash', 'Party']
+        statuses = ['Open', 'Closed']
         self.datasets['ez_complaints'] = pd.DataFrame({
-            'complaint_id': range(1, n_complaints + 1),
-            'address': np.random.choice(self.datasets['licensed_strs']['address'].tolist(), n_complaints),
-            'complaint_date': [datetime.now() - timedelta(days=np.random.randint(0, 730)) 
-                              for _ in range(n_complaints)],
-            'complaint_type': np.random.choice(['Noise', 'Parking', 'Trash', 'Party'], n_complaints),
-            'status': np.random.choice(['Open', 'Closed'], n_complaints, p=[0.2, 0.8]),
+            'complaint_id': np.arange(1, n_complaints + 1, dtype='int32'),
+            'address': rng.choice(addresses, n_complaints),
+            'complaint_date': pd.Timestamp.now() - pd.to_timedelta(rng.integers(0, 730, n_complaints), unit='D'),
+            'complaint_type': pd.Categorical(rng.choice(complaint_types, n_complaints), categories=complaint_types),
+            'status': pd.Categorical(rng.choice(statuses, n_complaints, p=[0.2, 0.8]), categories=statuses),
         })
         
-        print(f"✅ Sample data created for {self.city_name} development")
+        self._datasets_version += 1
+        
+        self.logger.info(f"✅ Sample data created for {self.city_name} development")
+
+def arrow_to_pandas(table) -> pd.DataFrame:
+    """
+    Convert an Arrow table from load_all_arrow() to a pandas DataFrame
+    
+    Columns are released as they are converted (self_destruct), which roughly
+    halves peak memory; the table must not be used afterwards.
+    
+    Args:
+        table: pyarrow.Table to convert
+        
+    Returns:
+        Arrow-backed DataFrame
+    """
+    return table.to_pandas(self_destruct=True, split_blocks=True, types_mapper=pd.ArrowDtype)
 
 # Quick usage functions for any city
 def load_city_str_data(city_name="Scottsdale", folder_id=None):
@@ -360,12 +904,12 @@ def load_city_str_data(city_name="Scottsdale", folder_id=None):
     try:
         datasets = loader.load_all_datasets()
         if not any(df is not None for df in datasets.values()):
-            print("⚠️  No data loaded, creating sample data for testing...")
+            loader.logger.warning("⚠️  No data loaded, creating sample data for testing...")
             loader.create_sample_data_for_testing()
             datasets = loader.datasets
     except Exception as e:
-        print(f"❌ Error loading data: {e}")
-        print("🔧 Creating sample data for testing...")
+        loader.logger.error(f"❌ Error loading data: {e}")
+        loader.logger.info("🔧 Creating sample data for testing...")
         loader.create_sample_data_for_testing()
         datasets = loader.datasets
     
@@ -398,14 +942,19 @@ def add_new_city(city_name: str, file_links: Dict[str, str], folder_id: str = No
 
 # Example usage
 if __name__ == "__main__":
-    # Set up logging
-    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+    # Set up logging; a MemoryHandler batches writes so concurrent downloads
+    # don't contend on the stream, and the bare format keeps the emoji prefixes
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    memory_handler = logging.handlers.MemoryHandler(capacity=100, target=stream_handler)
+    logging.basicConfig(level=logging.INFO, handlers=[memory_handler])
+    logger = logging.getLogger(__name__)
     
-    print("🏛️ Multi-City STR Data Loader")
-    print("=" * 35)
+    logger.info("🏛️ Multi-City STR Data Loader")
+    logger.info("=" * 35)
     
     # Load Scottsdale data (default)
     loader, datasets = load_city_str_data("Scottsdale")
     
-    print(f"\n🎯 Ready for {loader.city_name} STR nuisance analysis!")
-    print(f"📊 Loaded datasets: {list(datasets.keys())}")
+    logger.info(f"\n🎯 Ready for {loader.city_name} STR nuisance analysis!")
+    logger.info(f"📊 Loaded datasets: {list(datasets.keys())}")
@@ -33,7 +33,8 @@ class DataPipeline:
             'data_sources': {
                 'complaints': 'complaints.csv',
                 'properties': 'properties.csv'
-            }
+            },
+            'dedup_keys': ['property_id']
         }
     
     def load_data(self, data_path):
@@ -56,8 +57,13 @@ class DataPipeline:
             Cleaned dataframe
         """
         self.logger.info("Cleaning data...")
-        # Remove duplicates
-        df = df.drop_duplicates()
+        # Remove duplicates on the natural key; hashing every column of wide
+        # string tables is much slower. Fall back to whole rows without a key
+        dedup_keys = self.config.get('dedup_keys', ['property_id'])
+        if dedup_keys and all(key in df.columns for key in dedup_keys):
+            df = df.drop_duplicates(subset=dedup_keys, keep='last', ignore_index=True)
+        else:
+            df = df.drop_duplicates(ignore_index=True)
         
         # Handle missing values
         # TODO: Implement based on your EDA findings
@@ -78,6 +84,17 @@ class DataPipeline:
         
         return df
     
+    def engineer_features_chunked(self, chunks):
+        """
+        Engineer features over a stream of DataFrame chunks
+        Args:
+            chunks: Iterable of DataFrames, e.g. from STRDataLoader.iter_dataset
+        Yields:
+            DataFrames with engineered features, one per input chunk
+        """
+        for chunk in chunks:
+            yield self.engineer_features(chunk)
+    
     def run(self):
         """Execute the complete data pipeline"""
         self.logger.info(f"🔄 Starting data pipeline for {self.config['city_name']}")
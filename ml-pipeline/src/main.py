@@ -110,17 +110,21 @@ def export_predictions(predictions, logger):
     """
     logger.info("📊 Exporting predictions...")
     
+    # Categorise risk levels once and reuse them for the alert mask and summary
+    risk = predictions['risk_level'].astype('category')
+    high_mask = (risk == 'High').to_numpy()
+    
     # Create output directory
     output_dir = Path("output")
     output_dir.mkdir(exist_ok=True)
     
-    # Export full predictions for dashboard
-    dashboard_file = output_dir / f"predictions_dashboard_{datetime.now().strftime('%Y%m%d')}.csv"
-    predictions.to_csv(dashboard_file, index=False)
+    # Export full predictions for dashboard as columnar parquet (read with pd.read_parquet)
+    dashboard_file = output_dir / f"predictions_dashboard_{datetime.now().strftime('%Y%m%d')}.parquet"
+    predictions.to_parquet(dashboard_file, engine='pyarrow', compression='zstd', index=False)
     logger.info(f"📈 Dashboard data exported to: {dashboard_file}")
     
     # Export high-risk properties for alerts
-    high_risk = predictions[predictions['risk_level'] == 'High']
+    high_risk = predictions.loc[high_mask]
     if not high_risk.empty:
         alerts_file = output_dir / f"high_risk_alerts_{datetime.now().strftime('%Y%m%d')}.csv"
         high_risk.to_csv(alerts_file, index=False)
@@ -130,7 +134,7 @@ def export_predictions(predictions, logger):
         logger.info("✅ No high-risk properties identified")
     
     # Print summary statistics
-    risk_counts = predictions['risk_level'].value_counts()
+    risk_counts = risk.value_counts()
     logger.info("📊 Risk Level Summary:")
     for level, count in risk_counts.items():
         logger.info(f"   {level}: {count} properties")
@@ -11,9 +11,27 @@ import joblib
 import logging
 from pathlib import Path
 
+# Risk categories, lowest to highest
+RISK_LEVELS = ['Low', 'Medium', 'High']
+
+# Probability cut points between consecutive risk levels
+RISK_THRESHOLDS = [0.3, 0.7]
+
+# Input columns carried into prediction results to identify each property
+ID_COLUMNS = ['property_id', 'address']
+
 class NuisancePredictor:
     """ML model for predicting STR nuisance probability"""
     
+    # Example features (customize this); built once as an Index for fast lookups
+    # TODO: Implement based on your feature engineering; this should match your Colab analysis
+    _feature_index = pd.Index([
+        'complaint_count_last_year',
+        'property_age',
+        'neighborhood_risk_score',
+        # Add your actual features here
+    ])
+    
     def __init__(self, model_type="random_forest"):
         """
         Initialize predictor
@@ -34,18 +52,13 @@ class NuisancePredictor:
         Returns:
             Feature matrix (X) and target vector (y) if available
         """
-        # TODO: Implement based on your feature engineering
-        # This should match your Colab analysis
-        
-        # Example feature preparation (customize this)
-        feature_cols = [
-            'complaint_count_last_year',
-            'property_age',
-            'neighborhood_risk_score',
-            # Add your actual features here
-        ]
-        
-        X = df[feature_cols] if all(col in df.columns for col in feature_cols) else pd.DataFrame()
+        missing = self._feature_index.difference(df.columns)
+        if len(missing):
+            raise ValueError(f"Missing feature columns: {missing.tolist()}")
+        
+        # Trees work in float32 internally, so downcasting here halves the
+        # memory the model has to scan and avoids a conversion inside sklearn
+        X = df.reindex(columns=self._feature_index).apply(pd.to_numeric, downcast='float')
         y = df['is_nuisance'] if 'is_nuisance' in df.columns else None
         
         return X, y
@@ -74,6 +87,10 @@ class NuisancePredictor:
             self.model = RandomForestClassifier(
                 n_estimators=100,
                 max_depth=10,
+                max_features='sqrt',
+                min_samples_leaf=5,
+                bootstrap=True,
+                n_jobs=-1,  # Fit and score trees on all cores
                 random_state=42
             )
         
@@ -96,7 +113,9 @@ class NuisancePredictor:
         Args:
             df: Dataframe with features for prediction
         Returns:
-            DataFrame with predictions and probabilities
+            DataFrame with the identifying columns of df (see ID_COLUMNS, or
+            df's index as property_id if none are present), predictions and
+            probabilities, sharing df's index
         """
         if not self.is_trained:
             raise ValueError("Model must be trained before making predictions")
@@ -113,11 +132,17 @@ class NuisancePredictor:
         predictions = self.model.predict(X)
         probabilities = self.model.predict_proba(X)[:, 1]  # Probability of nuisance
         
-        # Create results dataframe
-        results = df.copy()
-        results['nuisance_prediction'] = predictions
-        results['nuisance_probability'] = probabilities
-        results['risk_level'] = self.categorize_risk(probabilities)
+        # Create a thin results dataframe rather than copying every input column
+        id_cols = [col for col in ID_COLUMNS if col in df.columns]
+        results = df[id_cols]
+        if not id_cols:
+            # Without an ID column the index is the only thing tying a row back to its property
+            results = results.assign(property_id=df.index)
+        results = results.assign(
+            nuisance_prediction=predictions,
+            nuisance_probability=probabilities,
+            risk_level=self.categorize_risk(probabilities),
+        )
         
         self.logger.info("✅ Predictions generated successfully")
         return results
@@ -128,21 +153,19 @@ class NuisancePredictor:
         Args:
             probabilities: Array of nuisance probabilities
         Returns:
-            Array of risk categories
+            Ordered categorical of risk levels
         """
-        risk_levels = []
-        for prob in probabilities:
-            if prob < 0.3:
-                risk_levels.append('Low')
-            elif prob < 0.7:
-                risk_levels.append('Medium')
-            else:
-                risk_levels.append('High')
-        
-        return risk_levels
+        codes = np.digitize(probabilities, bins=RISK_THRESHOLDS)
+        return pd.Categorical.from_codes(codes, categories=RISK_LEVELS, ordered=True)
     
-    def save_model(self, filepath):
-        """Save trained model to file"""
+    def save_model(self, filepath, compress=0):
+        """
+        Save trained model to file
+        Args:
+            filepath: Destination path
+            compress: joblib compression level; compression shrinks the file
+                but adds CPU time to every save and load, so it is off by default
+        """
         if not self.is_trained:
             raise ValueError("Cannot save untrained model")
         
@@ -152,7 +175,8 @@ class NuisancePredictor:
             'model_type': self.model_type
         }
         
-        joblib.dump(model_data, filepath)
+        # joblib writes numpy arrays itself; protocol 5 only governs how the remaining objects are pickled
+        joblib.dump(model_data, filepath, compress=compress, protocol=5)
         self.logger.info(f"💾 Model saved to {filepath}")
     
     def load_model(self, filepath):
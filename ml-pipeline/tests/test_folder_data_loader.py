@@ -0,0 +1,316 @@
+"""
+Tests for the Google Drive data loader, run against a local HTTP server
+"""
+
+import bz2
+import gzip
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import requests
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.data_processing.folder_data_loader import STRDataLoader
+
+N_ROWS = 5000
+CSV_BODY = b"id,kind\n" + b"".join(
+    b"%d,%s\n" % (i, b"noise" if i % 3 else b"trash") for i in range(N_ROWS)
+)
+
+
+class _CSVHandler(BaseHTTPRequestHandler):
+    """
+    Serves the same gzip-encoded CSV for every path, like a Drive download
+    
+    Response headers come from attributes on the server, so tests can change
+    validators between requests; every request's method is recorded.
+    """
+
+    def do_GET(self):
+        self._respond(include_body=True)
+
+    def do_HEAD(self):
+        self._respond(include_body=False)
+
+    def _respond(self, include_body):
+        self.server.requests.append(self.command)
+        body = self.server.body
+        self.send_response(200)
+        self.send_header('Content-Type', self.server.content_type)
+        if self.server.gzip_encoding:
+            body = gzip.compress(body)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        if self.server.etag:
+            self.send_header('ETag', self.server.etag)
+        if self.server.last_modified:
+            self.send_header('Last-Modified', self.server.last_modified)
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def httpd():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _CSVHandler)
+    httpd.body = CSV_BODY
+    httpd.content_type = 'text/csv'
+    httpd.gzip_encoding = True
+    httpd.etag = '"v1"'
+    httpd.last_modified = None
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def server(httpd):
+    return f"http://127.0.0.1:{httpd.server_port}"
+
+
+@pytest.fixture
+def loader(server, tmp_path, monkeypatch):
+    monkeypatch.setenv("STR_CACHE_DIR", str(tmp_path))
+    loader = STRDataLoader()
+    loader.get_direct_download_url = lambda file_id, confirm=False: f"{server}/{file_id}"
+    yield loader
+    loader.close()
+
+
+def test_load_dataset_reads_streamed_body_to_eof(loader):
+    df = loader.load_dataset('licensed_strs')
+
+    assert df is not None
+    assert df.shape == (N_ROWS, 2)
+    assert int(df['id'].iloc[-1]) == N_ROWS - 1
+
+
+def test_load_dataset_unknown_key_returns_none(loader):
+    assert loader.load_dataset('no_such_dataset') is None
+
+
+def test_load_all_datasets_loads_every_dataset(loader):
+    datasets = loader.load_all_datasets()
+
+    assert set(datasets) == set(loader.file_configs)
+    assert all(df is not None and len(df) == N_ROWS for df in datasets.values())
+
+
+def test_load_dataset_downcasts_arrow_integers(loader):
+    df = loader.load_dataset('licensed_strs')
+
+    assert df['id'].dtype == 'int16[pyarrow]'
+    assert df['kind'].dtype == 'category'
+
+
+def test_iter_dataset_streams_download_in_chunks(loader):
+    chunks = list(loader.iter_dataset('licensed_strs', chunksize=1000))
+
+    assert [len(chunk) for chunk in chunks] == [1000] * (N_ROWS // 1000)
+
+
+def test_iter_dataset_streams_cache_hit_in_chunks(loader):
+    loader.load_dataset('licensed_strs')
+
+    chunks = list(loader.iter_dataset('licensed_strs', chunksize=1000))
+
+    assert [len(chunk) for chunk in chunks] == [1000] * (N_ROWS // 1000)
+
+
+def test_iter_dataset_chunks_share_dtypes(loader, httpd):
+    # Ids cross the int8 range and each chunk holds a different set of kinds
+    kinds = [b"noise"] * 100 + [b"noise", b"trash"] * 50 + [b"trash"] * 100
+    httpd.body = b"id,kind\n" + b"".join(b"%d,%s\n" % (i, kind) for i, kind in enumerate(kinds))
+
+    downloaded = list(loader.iter_dataset('licensed_strs', chunksize=100))
+    loader.load_dataset('licensed_strs')
+    cached = list(loader.iter_dataset('licensed_strs', chunksize=100))
+
+    assert len(downloaded) == len(cached) == 3
+    expected = downloaded[0].dtypes
+    assert all((chunk.dtypes == expected).all() for chunk in downloaded + cached)
+    assert pd.concat(downloaded)['kind'].dtype == 'string[pyarrow]'
+
+
+def _expire(loader, dataset_key):
+    """Backdate a dataset's cache entry past the loader's TTL"""
+    config = loader.file_configs[dataset_key]
+    cache_path = loader._cache_path(config['file_id'], config)
+    stale = os.path.getmtime(cache_path) - loader.cache_ttl - 60
+    os.utime(cache_path, (stale, stale))
+    return cache_path
+
+
+def test_load_dataset_uses_stale_cache_when_utime_fails(loader, httpd, monkeypatch):
+    loader.load_dataset('licensed_strs')
+    _expire(loader, 'licensed_strs')
+
+    def read_only(*args, **kwargs):
+        raise PermissionError("read-only cache dir")
+    monkeypatch.setattr(os, 'utime', read_only)
+    df = loader.load_dataset('licensed_strs')
+
+    assert df is not None and len(df) == N_ROWS
+    assert httpd.requests == ['GET', 'HEAD']
+
+
+def test_load_dataset_downloads_when_cache_entry_vanishes(loader, httpd, monkeypatch):
+    loader.load_dataset('licensed_strs')
+
+    def vanished(path):
+        raise FileNotFoundError(path)
+    monkeypatch.setattr(os.path, 'getmtime', vanished)
+    df = loader.load_dataset('licensed_strs')
+
+    assert df is not None and len(df) == N_ROWS
+    assert httpd.requests == ['GET', 'GET']
+
+
+def test_cache_hit_matches_fresh_download(loader):
+    fresh = loader.load_dataset('licensed_strs')
+    cached = loader.load_dataset('licensed_strs')
+
+    assert (cached.dtypes == fresh.dtypes).all()
+    pd.testing.assert_frame_equal(cached, fresh)
+
+
+def test_category_threshold_applies_to_cache_hits(loader, httpd, server, tmp_path):
+    loader.load_dataset('licensed_strs')
+
+    plain = STRDataLoader(cache_dir=tmp_path, category_threshold=0)
+    plain.get_direct_download_url = lambda file_id, confirm=False: f"{server}/{file_id}"
+    try:
+        df = plain.load_dataset('licensed_strs')
+    finally:
+        plain.close()
+
+    assert df['kind'].dtype == 'string[pyarrow]'
+    assert httpd.requests == ['GET']
+
+
+def test_fresh_cache_entry_skips_the_network(loader, httpd):
+    loader.load_dataset('licensed_strs')
+    df = loader.load_dataset('licensed_strs')
+
+    assert len(df) == N_ROWS
+    assert httpd.requests == ['GET']
+
+
+def test_stale_entry_with_unchanged_etag_is_renewed(loader, httpd):
+    loader.load_dataset('licensed_strs')
+    cache_path = _expire(loader, 'licensed_strs')
+
+    df = loader.load_dataset('licensed_strs')
+
+    assert len(df) == N_ROWS
+    assert httpd.requests == ['GET', 'HEAD']
+    # Renewed for another TTL, so the next load doesn't revalidate again
+    loader.load_dataset('licensed_strs')
+    assert httpd.requests == ['GET', 'HEAD']
+    assert time.time() - os.path.getmtime(cache_path) < loader.cache_ttl
+
+
+def test_stale_entry_with_changed_etag_is_downloaded_again(loader, httpd):
+    loader.load_dataset('licensed_strs')
+    _expire(loader, 'licensed_strs')
+
+    httpd.etag = '"v2"'
+    loader.load_dataset('licensed_strs')
+
+    assert httpd.requests == ['GET', 'HEAD', 'GET']
+
+
+def test_etag_takes_precedence_over_last_modified(loader, httpd):
+    httpd.last_modified = 'Wed, 01 Oct 2025 00:00:00 GMT'
+    loader.load_dataset('licensed_strs')
+    _expire(loader, 'licensed_strs')
+
+    httpd.etag = '"v2"'
+    loader.load_dataset('licensed_strs')
+
+    assert httpd.requests == ['GET', 'HEAD', 'GET']
+
+
+def test_last_modified_revalidates_without_etag(loader, httpd):
+    httpd.etag = None
+    httpd.last_modified = 'Wed, 01 Oct 2025 00:00:00 GMT'
+    loader.load_dataset('licensed_strs')
+    _expire(loader, 'licensed_strs')
+
+    loader.load_dataset('licensed_strs')
+    assert httpd.requests == ['GET', 'HEAD']
+
+    _expire(loader, 'licensed_strs')
+    httpd.last_modified = 'Thu, 02 Oct 2025 00:00:00 GMT'
+    loader.load_dataset('licensed_strs')
+    assert httpd.requests == ['GET', 'HEAD', 'HEAD', 'GET']
+
+
+@pytest.mark.parametrize('meta', [None, '{not json'])
+def test_stale_entry_without_readable_validators_is_downloaded_again(loader, httpd, meta):
+    loader.load_dataset('licensed_strs')
+    meta_path = loader._meta_path(_expire(loader, 'licensed_strs'))
+    if meta is None:
+        meta_path.unlink()
+    else:
+        meta_path.write_text(meta)
+
+    df = loader.load_dataset('licensed_strs')
+
+    assert len(df) == N_ROWS
+    assert httpd.requests == ['GET', 'GET']
+
+
+def test_failed_head_request_downloads_again(loader, httpd, monkeypatch):
+    loader.load_dataset('licensed_strs')
+    _expire(loader, 'licensed_strs')
+
+    def unreachable(*args, **kwargs):
+        raise requests.ConnectionError("HEAD failed")
+    monkeypatch.setattr(loader._session, 'head', unreachable)
+    df = loader.load_dataset('licensed_strs')
+
+    assert len(df) == N_ROWS
+    assert httpd.requests == ['GET', 'GET']
+
+
+def test_virus_scan_page_is_not_parsed(loader, httpd, caplog):
+    httpd.content_type = 'text/html; charset=utf-8'
+    httpd.body = (b"<!DOCTYPE html><html><head><title>Google Drive - Virus scan warning</title>"
+                  b"</head><body>Google Drive can't perform a virus scan on this file.</body></html>")
+
+    assert loader.load_dataset('licensed_strs') is None
+    assert "virus scan warning" in caplog.text
+
+
+def test_csv_served_as_html_is_still_parsed(loader, httpd):
+    httpd.content_type = 'text/html'
+
+    df = loader.load_dataset('licensed_strs')
+
+    assert df is not None and len(df) == N_ROWS
+
+
+@pytest.mark.parametrize('suffix, compress', [('.csv.gz', gzip.compress), ('.csv.bz2', bz2.compress)])
+def test_compression_is_inferred_from_the_filename(loader, httpd, suffix, compress):
+    loader.file_configs['licensed_strs']['filename'] = 'Licensed_Short-term_Rental_Public' + suffix
+    httpd.gzip_encoding = False
+    httpd.body = compress(CSV_BODY)
+
+    df = loader.load_dataset('licensed_strs')
+
+    assert df is not None and df.shape == (N_ROWS, 2)
@@ -0,0 +1,43 @@
+"""
+Tests for the data processing pipeline's cleaning step
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.data_processing.pipeline import DataPipeline
+
+
+@pytest.fixture
+def make_pipeline(tmp_path):
+    def make(config_text):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(config_text)
+        return DataPipeline(config_path=str(config_path))
+    return make
+
+
+def test_clean_data_keeps_last_row_per_key(make_pipeline):
+    pipeline = make_pipeline("dedup_keys: [property_id]\n")
+    df = pd.DataFrame({'property_id': [1, 2, 1], 'complaints': [3, 5, 4]}, index=[10, 11, 12])
+
+    cleaned = pipeline.clean_data(df)
+
+    assert cleaned.to_dict('list') == {'property_id': [2, 1], 'complaints': [5, 4]}
+    assert list(cleaned.index) == [0, 1]
+
+
+def test_clean_data_falls_back_to_whole_rows_without_key_columns(make_pipeline):
+    pipeline = make_pipeline("dedup_keys: [parcel_id]\n")
+    df = pd.DataFrame({'property_id': [1, 1, 1], 'complaints': [3, 3, 4]}, index=[10, 11, 12])
+
+    cleaned = pipeline.clean_data(df)
+
+    assert cleaned.to_dict('list') == {'property_id': [1, 1], 'complaints': [3, 4]}
+    assert list(cleaned.index) == [0, 1]
@@ -0,0 +1,77 @@
+"""
+Tests for the nuisance predictor's feature preparation and result shaping
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.modeling.predictor import NuisancePredictor
+
+FEATURES = ['complaint_count_last_year', 'property_age', 'neighborhood_risk_score']
+
+
+def _training_frame(n_rows=200):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'complaint_count_last_year': rng.integers(0, 5, n_rows),
+        'property_age': rng.integers(1, 50, n_rows),
+        'neighborhood_risk_score': rng.random(n_rows),
+        'is_nuisance': rng.integers(0, 2, n_rows),
+    }, index=range(1000, 1000 + n_rows))
+
+
+@pytest.fixture
+def trained():
+    predictor = NuisancePredictor()
+    predictor.train(_training_frame())
+    return predictor
+
+
+def test_categorize_risk_bin_edges_belong_to_the_higher_level():
+    levels = NuisancePredictor().categorize_risk(np.array([0.0, 0.29, 0.3, 0.69, 0.7, 1.0]))
+
+    assert list(levels) == ['Low', 'Low', 'Medium', 'Medium', 'High', 'High']
+    assert levels.ordered
+    assert list(levels.categories) == ['Low', 'Medium', 'High']
+
+
+def test_prepare_features_names_missing_columns():
+    df = _training_frame().drop(columns=['property_age'])
+
+    with pytest.raises(ValueError, match="property_age"):
+        NuisancePredictor().prepare_features(df)
+
+
+def test_prepare_features_selects_features_as_float32():
+    X, y = NuisancePredictor().prepare_features(_training_frame().assign(address='x'))
+
+    assert list(X.columns) == FEATURES
+    assert (X.dtypes == np.float32).all()
+    assert y is not None
+
+
+def test_predict_returns_id_columns_and_results_only(trained):
+    df = _training_frame().drop(columns='is_nuisance').assign(property_id='p', address='a', extra=1)
+
+    results = trained.predict(df)
+
+    assert list(results.columns) == [
+        'property_id', 'address', 'nuisance_prediction', 'nuisance_probability', 'risk_level',
+    ]
+    assert results.index.equals(df.index)
+
+
+def test_predict_without_id_columns_uses_the_index(trained):
+    df = _training_frame().drop(columns='is_nuisance')
+
+    results = trained.predict(df)
+
+    assert list(results['property_id']) == list(df.index)
+    assert results['risk_level'].dtype == 'category'